@@ -7,6 +7,7 @@ en utilisant le framework web.py. Il gère :
 2. La gestion du changement de langue (Français et Anglais).
 3. Le traitement des requêtes GET (affichage de la pièce) et POST (action utilisateur).
 4. La navigation dans la carte du jeu (gothonmap.map).
+5. Le préchargement des images des pièces suivantes (prefetch, Early Hints).
 """
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
@@ -38,6 +39,7 @@ if project_root not in sys.path:
 # Importer le framework web et le fichier de la carte du jeu
 import web
 from gothonmap import map
+from bin.compression import PAGE_KEY
 
 
 # --- Fonctions d'Aide pour la Gestion des Sessions (Fichiers JSON) ---
@@ -117,6 +119,33 @@ def initialize_or_reset_session(lang):
     return session_id
 
 
+# --- Fonction d'Aide pour le Préchargement des Images ---
+
+def send_prefetch_hints(room):
+    """
+    Annonce au navigateur les images des pièces suivantes.
+
+    Ajoute un en-tête 'Link' (rel=prefetch) à la réponse. Si le serveur WSGI
+    fournit un callable 'wsgi.early_hints', les mêmes en-têtes sont aussi
+    envoyés en avance dans une réponse 103 Early Hints.
+
+    Args:
+        room (Room): La pièce affichée.
+    """
+    assets = map.NEXT_ASSETS.get(room.tag)
+    if not assets:
+        return
+
+    link = ", ".join(f"<{asset}>; rel=prefetch" for asset in assets)
+
+    # Envoyer les Early Hints (103) uniquement si le serveur les supporte
+    early_hints = web.ctx.env.get("wsgi.early_hints")
+    if callable(early_hints):
+        early_hints([("Link", link)])
+
+    web.header("Link", link)
+
+
 # --- Définition des URLs et de l'Application ---
 
 urls = (
@@ -133,8 +162,10 @@ app = web.application(urls, globals())
 # --- Moteurs de Rendu des Templates ---
 
 template_path = os.path.join(project_root, "templates")
-render_en = web.template.render(template_path, base = "layout")
-render_fr = web.template.render(template_path, base = "layout")
+# Exposer les images des pièces suivantes au layout (balises <link rel="prefetch">)
+template_globals = {"next_assets": map.NEXT_ASSETS}
+render_en = web.template.render(template_path, base = "layout", globals = template_globals)
+render_fr = web.template.render(template_path, base = "layout", globals = template_globals)
 
 
 # --- Classes de Gestion des Index ---
@@ -192,6 +223,12 @@ class GameEngineBase():
         # Charger l'objet Room réel
         current_room = getattr(map, session_data['room'])
 
+        # Précharger les images des pièces suivantes (Link + Early Hints)
+        send_prefetch_hints(current_room)
+
+        # Identifier la page rendue (pièce, langue) pour le cache de compression
+        web.ctx.env[PAGE_KEY] = (current_room.tag, self.lang)
+
         # Utiliser le moteur de rendu spécifique à la langue
         if self.lang == "en":
             return self.render.show_room_en(room = current_room, session = session_data)
@@ -0,0 +1,126 @@
+"""
+Banc d'essai de la compression gzip des pages de pièces.
+
+Ce script rend chaque page (pièce × langue) à travers le middleware
+GzipMiddleware et rapporte, pour plusieurs niveaux de compression :
+1. Les octets servis avant et après compression (octets économisés).
+2. Le coût CPU de la compression seule (cache vide).
+3. Le temps CPU moyen d'une requête complète (rendu + middleware) : sans
+   compression, au premier passage (cache vide) et au second passage (cache).
+"""
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import sys
+import os
+import time
+import uuid
+from wsgiref.util import setup_testing_defaults
+
+# Ajouter le répertoire racine à sys.path pour pouvoir importer bin et gothonmap
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from bin.app import app, save_session_data, get_session_file_path
+from bin.compression import GzipMiddleware
+from gothonmap import map
+
+
+# Niveaux de compression comparés
+LEVELS = (1, 6, 9)
+
+# Nombre de répétitions de chaque mesure (pour lisser le bruit)
+ROUNDS = 5
+
+
+def request_page(application, session_id, lang):
+    """
+    Exécute une requête GET sur la page de jeu et retourne le corps servi.
+
+    Args:
+        application (callable): L'application WSGI à interroger.
+        session_id (str): L'identifiant de la session du banc d'essai.
+        lang (str): La langue de la page ('en' ou 'fr').
+
+    Returns:
+        bytes: Le corps de la réponse (compressé ou non).
+    """
+    environ = {
+        "PATH_INFO": f"/game_{lang}",
+        "HTTP_COOKIE": f"my_session_id={session_id}",
+        "HTTP_ACCEPT_ENCODING": "gzip, deflate",
+    }
+    setup_testing_defaults(environ)
+    return b"".join(application(environ, lambda status, headers, exc_info = None: None))
+
+
+def serve_all_pages(application, session_id):
+    """
+    Sert une fois chaque page (pièce × langue) et mesure le temps CPU des requêtes.
+
+    L'écriture du fichier de session qui prépare chaque page n'est pas mesurée.
+
+    Args:
+        application (callable): L'application WSGI à interroger.
+        session_id (str): L'identifiant de la session du banc d'essai.
+
+    Returns:
+        float: Le temps CPU total des requêtes, en secondes.
+    """
+    elapsed = 0.0
+    for tag in map.ROOMS:
+        for lang in ("en", "fr"):
+            save_session_data(session_id, {"room": tag, "lang": lang})
+            start = time.process_time()
+            request_page(application, session_id, lang)
+            elapsed += time.process_time() - start
+    return elapsed
+
+
+def main():
+    """Affiche les octets économisés et le coût CPU pour chaque niveau."""
+    # Session temporaire unique, pour ne jamais écraser une session réelle
+    session_id = str(uuid.uuid4())
+    wsgi_app = app.wsgifunc()
+    pages = len(map.ROOMS) * 2
+
+    try:
+        # Référence : requêtes servies sans middleware de compression
+        plain = sum(serve_all_pages(wsgi_app, session_id) for _ in range(ROUNDS))
+        plain = plain / (ROUNDS * pages)
+
+        print(f"Pages: {pages} ({len(map.ROOMS)} pièces × 2 langues), {ROUNDS} passages")
+        print(f"Requête sans compression: {plain * 1000:.3f} ms/page")
+        print(f"{'niveau':>6} {'brut':>9} {'gzip':>9} {'économisé':>15} "
+              f"{'gzip/page':>10} {'requête à froid':>16} {'requête en cache':>17}")
+
+        for level in LEVELS:
+            cold = warm = 0.0
+            for _ in range(ROUNDS):
+                # Nouveau middleware (cache vide) à chaque répétition
+                middleware = GzipMiddleware(wsgi_app, compress_level = level)
+                cold += serve_all_pages(middleware, session_id)
+                stats = dict(middleware.stats)
+                warm += serve_all_pages(middleware, session_id)
+            cold = cold / (ROUNDS * pages)
+            warm = warm / (ROUNDS * pages)
+
+            saved = stats["bytes_in"] - stats["bytes_out"]
+            ratio = saved / stats["bytes_in"] if stats["bytes_in"] else 0.0
+            cpu = stats["compress_time"] / max(stats["compressions"], 1)
+            print(f"{level:>6} {stats['bytes_in']:>9} {stats['bytes_out']:>9} "
+                  f"{saved:>9} ({ratio:.0%}) {cpu * 1000:>7.3f} ms "
+                  f"{cold * 1000:>13.3f} ms {warm * 1000:>14.3f} ms")
+    finally:
+        # Supprimer le fichier de session temporaire
+        session_file = get_session_file_path(session_id)
+        if os.path.exists(session_file):
+            os.remove(session_file)
+
+
+# Bloc d'exécution principal
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Middleware WSGI de compression gzip des réponses.
+
+Ce module enveloppe l'application WSGI pour compresser les pages HTML :
+1. La négociation de l'en-tête 'Accept-Encoding' (gzip uniquement).
+2. Un seuil de taille en dessous duquel la réponse n'est pas compressée.
+3. Un niveau de compression configurable.
+4. Un cache des octets compressés pour les pages identifiées par l'application
+   (clé PAGE_KEY dans l'environ WSGI, par exemple (pièce, langue)).
+"""
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import gzip
+import time
+import zlib
+
+
+# Clé de l'environ WSGI où l'application dépose l'identifiant de la page rendue
+PAGE_KEY = "gothonweb.page_key"
+
+# Types de contenu pouvant être compressés
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript")
+
+
+def accepts_gzip(accept_encoding):
+    """
+    Détermine si le client accepte l'encodage gzip.
+
+    Args:
+        accept_encoding (str): La valeur de l'en-tête 'Accept-Encoding'.
+
+    Returns:
+        bool: True si gzip (ou '*') est accepté avec une qualité non nulle.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        # Chercher le paramètre 'q' parmi tous les paramètres (insensible à la casse)
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    # Une mention explicite de gzip l'emporte sur le joker '*'
+    if "gzip" in qualities:
+        return qualities["gzip"] > 0
+    return qualities.get("*", 0) > 0
+
+
+def add_vary(headers):
+    """
+    Ajoute 'Accept-Encoding' à l'en-tête 'Vary' (en conservant les valeurs existantes).
+
+    Args:
+        headers (list): Les en-têtes [(nom, valeur)] de la réponse.
+
+    Returns:
+        list: Les nouveaux en-têtes.
+    """
+    vary = [value for name, value in headers if name.lower() == "vary"]
+    headers = [(name, value) for name, value in headers if name.lower() != "vary"]
+    headers.append(("Vary", ", ".join(vary + ["Accept-Encoding"])))
+    return headers
+
+
+class GzipMiddleware():
+    """
+    Compresse en gzip les réponses de l'application WSGI enveloppée.
+
+    Les pages identifiées par l'application via PAGE_KEY sont compressées une
+    seule fois : les octets obtenus sont conservés par (page, encodage), avec
+    une empreinte du corps rendu pour détecter une page modifiée.
+    """
+
+    def __init__(self, app, compress_level = 6, min_size = 500):
+        """
+        Initialise le middleware.
+
+        Args:
+            app (callable): L'application WSGI à envelopper.
+            compress_level (int, optional): Le niveau de compression gzip (1 à 9).
+            min_size (int, optional): La taille minimale (en octets) à compresser.
+        """
+        self.app = app
+        self.compress_level = compress_level
+        self.min_size = min_size
+
+        # Cache des pages compressées {(page, encodage): (taille, crc32, octets)}
+        self.cache = {}
+
+        # Statistiques (octets servis avant/après, temps CPU de compression, cache)
+        self.stats = {"bytes_in": 0, "bytes_out": 0, "compress_time": 0.0,
+                      "compressions": 0, "cache_hits": 0}
+
+    def __call__(self, environ, start_response):
+        """Traite une requête WSGI et compresse la réponse si possible."""
+        gzip_accepted = accepts_gzip(environ.get("HTTP_ACCEPT_ENCODING", ""))
+
+        # Intercepter le statut et les en-têtes de l'application
+        response = {}
+        body = []
+
+        def capture_start_response(status, headers, exc_info = None):
+            if not self.is_compressible(status, headers):
+                # Réponse non compressible : la transmettre telle quelle
+                response["buffered"] = False
+                return start_response(status, headers, exc_info)
+
+            # La page dépend de 'Accept-Encoding', compressée ou non
+            headers = add_vary(headers)
+            if not gzip_accepted:
+                response["buffered"] = False
+                return start_response(status, headers, exc_info)
+
+            # Différer l'envoi des en-têtes jusqu'à la compression du corps
+            response.update(buffered = True, status = status, headers = headers,
+                            exc_info = exc_info)
+            return body.append
+
+        result = self.app(environ, capture_start_response)
+        if "buffered" not in response:
+            # start_response pas encore appelé : il le sera au premier élément
+            result = self.consume(result)
+        if not response["buffered"]:
+            return result
+
+        body.extend(self.consume(result))
+        body = b"".join(body)
+        status, headers = response["status"], response["headers"]
+
+        if len(body) < self.min_size:
+            start_response(status, headers, response["exc_info"])
+            return [body]
+
+        compressed = self.compress(environ.get(PAGE_KEY), body)
+        self.stats["bytes_in"] += len(body)
+        self.stats["bytes_out"] += len(compressed)
+
+        # Remplacer la longueur et annoncer l'encodage
+        headers = [(name, value) for name, value in headers
+                   if name.lower() not in ("content-length", "content-encoding")]
+        headers.append(("Content-Encoding", "gzip"))
+        headers.append(("Content-Length", str(len(compressed))))
+
+        start_response(status, headers, response["exc_info"])
+        return [compressed]
+
+    @staticmethod
+    def consume(result):
+        """
+        Lit entièrement l'itérable retourné par l'application, puis le ferme.
+
+        Args:
+            result (iterable): Le corps retourné par l'application WSGI.
+
+        Returns:
+            list: Les morceaux (bytes) du corps.
+        """
+        try:
+            return list(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+
+    def is_compressible(self, status, headers):
+        """
+        Indique si une réponse peut être compressée (avant de lire son corps).
+
+        Args:
+            status (str): Le statut HTTP (ex. '200 OK').
+            headers (list): Les en-têtes [(nom, valeur)] de la réponse.
+
+        Returns:
+            bool: True si la réponse est un succès textuel non encore encodé.
+        """
+        if not status.startswith("200"):
+            return False
+        headers = {name.lower(): value for name, value in headers}
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def compress(self, page_key, body):
+        """
+        Compresse le corps, en réutilisant le cache si la page est connue.
+
+        Args:
+            page_key (tuple or None): L'identifiant de la page (ex. (pièce, langue)).
+            body (bytes): Le corps non compressé.
+
+        Returns:
+            bytes: Le corps compressé en gzip.
+        """
+        cache_key = (page_key, "gzip")
+        fingerprint = (len(body), zlib.crc32(body))
+        cached = self.cache.get(cache_key) if page_key is not None else None
+        # Réutiliser les octets compressés seulement si le corps rendu est identique
+        if cached and cached[:2] == fingerprint:
+            self.stats["cache_hits"] += 1
+            return cached[2]
+
+        # mtime = 0 pour obtenir des octets identiques d'une compression à l'autre
+        start = time.perf_counter()
+        compressed = gzip.compress(body, compresslevel = self.compress_level, mtime = 0)
+        self.stats["compress_time"] += time.perf_counter() - start
+        self.stats["compressions"] += 1
+
+        if page_key is not None:
+            self.cache[cache_key] = fingerprint + (compressed,)
+        return compressed
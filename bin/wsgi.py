@@ -29,7 +29,14 @@ if path not in sys.path:
 
 # Importer l'objet application depuis le module 'app' situé dans 'bin'
 from bin.app import app
+# Importer le middleware de compression gzip
+from bin.compression import GzipMiddleware
+
+# Paramètres de la compression gzip des réponses
+COMPRESS_LEVEL = 6  # Niveau de compression (1 = rapide, 9 = compact)
+COMPRESS_MIN_SIZE = 500  # Taille minimale (en octets) d'une réponse à compresser
 
 # Créer l'objet WSGI (Web Server Gateway Interface)
 # L'objet 'application' est celui qui sera utilisé par le serveur web (comme Gunicorn ou Apache/mod_wsgi)
-application = app.wsgifunc()
+application = GzipMiddleware(app.wsgifunc(), compress_level = COMPRESS_LEVEL,
+                             min_size = COMPRESS_MIN_SIZE)
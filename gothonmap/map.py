@@ -95,6 +95,45 @@ class Room():
         # Mettre à jour le dictionnaire des chemins avec les nouvelles routes
         self.paths.update(paths)
 
+    def next_assets(self):
+        """
+        Retourne les images distinctes des pièces voisines (atteignables via paths).
+
+        Les images déjà affichées par cette pièce sont exclues, puisque le
+        navigateur les a déjà en cache.
+
+        Returns:
+            tuple: Les chemins des images, dans l'ordre de découverte.
+        """
+        own_assets = (self.img_one, self.img_two)
+        assets = []
+        for room in self.paths.values():
+            for asset in (room.img_one, room.img_two):
+                # Ignorer les images absentes, déjà vues ou déjà listées
+                if asset and asset not in own_assets and asset not in assets:
+                    assets.append(asset)
+        return tuple(assets)
+
+
+def collect_rooms(start):
+    """
+    Parcourt la carte depuis une pièce et retourne toutes les pièces atteignables.
+
+    Args:
+        start (Room): La pièce de départ du parcours.
+
+    Returns:
+        dict: Dictionnaire {tag: Room_objet} des pièces atteignables.
+    """
+    rooms = {}
+    pending = [start]
+    while pending:
+        room = pending.pop()
+        if room.tag not in rooms:
+            rooms[room.tag] = room
+            pending.extend(room.paths.values())
+    return rooms
+
 
 # --- Définition des pièces du jeu ---
 
@@ -403,3 +442,7 @@ escape_pod_3.add_paths({
 # Définir la pièce de départ du jeu (exportée)
 START = lower_deck_cursive
 
+
+# Précalculer, pour chaque pièce, les images des pièces suivantes (prefetch)
+ROOMS = collect_rooms(START)
+NEXT_ASSETS = {tag: room.next_assets() for tag, room in ROOMS.items()}